@@ -9,8 +9,10 @@ from sqlalchemy.ext.asyncio import (
     create_async_engine,
     async_sessionmaker,
 )
-from sqlalchemy.orm import declarative_base
-from sqlalchemy.pool import NullPool
+from sqlalchemy import text
+from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from datetime import date, timedelta
 from typing import AsyncGenerator
 
 from app.config import settings
@@ -29,12 +31,31 @@ engine = create_async_engine(
     future=True,
     pool_pre_ping=True,  # Verify connections before using
     pool_recycle=3600,  # Recycle connections after 1 hour
-    poolclass=NullPool if settings.ENVIRONMENT == "development" else None,
+    # AsyncAdaptedQueuePool (not QueuePool!) is the asyncio-safe queue pool.
+    # LIFO keeps the hottest connections in rotation, which plays nicely with
+    # the Postgres backend caches.
+    poolclass=AsyncAdaptedQueuePool,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=30,
+    pool_use_lifo=True,
+    # SQL-compilation cache (default 500). Sized above our distinct
+    # statement count so hot queries never get evicted and recompiled.
+    query_cache_size=1200,
     connect_args={
         "timeout": 30,
+        # Prepared-statement caches let repeated ORM queries skip the server
+        # parse/plan step. Both MUST be 0 behind pgbouncer/Supavisor in
+        # transaction mode, where statements don't survive across backends.
+        "statement_cache_size": 0 if settings.DB_BEHIND_PGBOUNCER else 1024,
+        "prepared_statement_cache_size": 0 if settings.DB_BEHIND_PGBOUNCER else 500,
         "server_settings": {
             "application_name": "contentflow_api",
             "jit": "off",  # Disable JIT for predictable performance
+            # Evict dead NAT/k8s connections before queries fail on them
+            "tcp_keepalives_idle": "30",
+            "tcp_keepalives_interval": "10",
+            "tcp_keepalives_count": "3",
         },
     },
 )
@@ -46,8 +67,9 @@ async_session = async_sessionmaker(
     autoflush=False,
 )
 
-# Base class for all ORM models
-Base = declarative_base()
+# Base class for all ORM models (2.0-style declarative mapping)
+class Base(DeclarativeBase):
+    pass
 
 
 # ============================================================================
@@ -81,10 +103,33 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
 async def init_db():
     """Create all database tables"""
     async with engine.begin() as conn:
+        # The halfvec columns need the pgvector extension before
+        # create_all runs, or CREATE TABLE fails on a fresh database
+        await conn.execute(text("CREATE EXTENSION IF NOT EXISTS vector"))
         await conn.run_sync(Base.metadata.create_all)
+        await _ensure_audit_log_partitions(conn)
     logger.info("✅ Database tables created")
 
 
+async def _ensure_audit_log_partitions(conn, months_ahead: int = 3):
+    """
+    Create monthly audit_logs partitions for the current month and the
+    next months_ahead. Idempotent; re-run at every startup so partitions
+    always exist before inserts land in them.
+    """
+    month = date.today().replace(day=1)
+    for _ in range(months_ahead + 1):
+        next_month = (month.replace(day=28) + timedelta(days=4)).replace(day=1)
+        await conn.execute(
+            text(
+                f"CREATE TABLE IF NOT EXISTS audit_logs_{month:%Y_%m} "
+                f"PARTITION OF audit_logs "
+                f"FOR VALUES FROM ('{month}') TO ('{next_month}')"
+            )
+        )
+        month = next_month
+
+
 async def drop_db():
     """Drop all database tables (use with caution!)"""
     async with engine.begin() as conn:
@@ -4,19 +4,25 @@ ContentFlow - FastAPI Backend Entry Point
 Orchestrates video-to-content transformation using LangGraph agents.
 """
 
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 from typing import Optional
 
+import orjson
+
+from brotli_asgi import BrotliMiddleware
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.middleware.gzip import GZIPMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
-from app.config import settings
-from app.database import engine, Base, get_db
-from app.api.routes import router as api_router
+# NOTE: top-level imports here must stay I/O-free and cheap. Heavy modules
+# (app.api.routes pulls in the AI orchestrator, vector store and SQLAlchemy
+# models transitively) are imported inside lifespan so uvicorn can bind the
+# port before they load.
+from app.config import settings, validate_settings
+from app.database import engine, Base, get_db, init_db
 from app.utils.logger import setup_logger
 from app.utils.exceptions import ContentFlowException
 
@@ -38,17 +44,62 @@ async def lifespan(app: FastAPI):
     try:
         # Startup
         logger.info("🚀 Starting ContentFlow Backend")
-        
-        # Create database tables
-        async with engine.begin() as conn:
-            await conn.run_sync(Base.metadata.create_all)
+
+        # Fail fast on missing critical configuration
+        if settings.ENVIRONMENT != "development":
+            try:
+                validate_settings()
+            except ValueError as e:
+                logger.warning(f"⚠️ {str(e)}")
+
+        # Register API routes (lazy import: routes pulls in the AI stack).
+        # Guarded: lifespan runs once per startup cycle, and the module-level
+        # app outlives them (e.g. repeated TestClient contexts) — mounting
+        # again would duplicate every route.
+        if not getattr(app.state, "routes_registered", False):
+            from app.api.routes import router as api_router
+            app.include_router(api_router, prefix="/api", tags=["Content Generation"])
+            app.state.routes_registered = True
+            logger.info("✅ API routes registered")
+
+        # Create database tables and the audit_logs monthly partitions —
+        # the partitioned parent rejects inserts until children exist
+        await init_db()
         logger.info("✅ Database tables initialized")
-        
+
         # Initialize vector store (Chroma or similar)
         from app.services.vector_store import init_vector_store
         await init_vector_store()
         logger.info("✅ Vector store initialized")
-        
+
+        # Pre-warm before traffic arrives: fill the pool so no request pays
+        # asyncpg's first-connection type introspection, and probe the
+        # ivfflat index once to pull its cold pages into the buffer cache.
+        from sqlalchemy import text
+
+        async def _warm_connection():
+            async with engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+
+        await asyncio.gather(
+            *(_warm_connection() for _ in range(settings.DB_POOL_SIZE))
+        )
+
+        try:
+            zero_vec = "[" + ",".join(["0"] * 1536) + "]"
+            async with engine.connect() as conn:
+                await conn.execute(
+                    text(
+                        "SELECT id FROM embedding_cache "
+                        "ORDER BY embedding <=> :q::halfvec LIMIT 1"
+                    ),
+                    {"q": zero_vec},
+                )
+        except Exception as e:
+            # Warmup is best-effort; an empty or missing index isn't fatal
+            logger.warning(f"⚠️ Vector index warmup skipped: {str(e)}")
+        logger.info("✅ Connection pool and vector index pre-warmed")
+
         yield
         
     except Exception as e:
@@ -72,6 +123,9 @@ app = FastAPI(
     docs_url="/api/docs",
     openapi_url="/api/openapi.json",
     lifespan=lifespan,
+    # orjson encodes in C (native UUID/datetime support) — 5-10x faster
+    # than stdlib json on the nested generated_content payloads
+    default_response_class=ORJSONResponse,
 )
 
 
@@ -85,8 +139,10 @@ app.add_middleware(
     allowed_hosts=settings.ALLOWED_HOSTS,
 )
 
-# 2. GZIP - Compression
-app.add_middleware(GZIPMiddleware, minimum_size=1000)
+# 2. Brotli - Compression (falls back to gzip for clients without br
+# support; quality 4 gives gzip-level ratios at a fraction of the CPU,
+# and the C encoder doesn't block the event loop like gzip.compress)
+app.add_middleware(BrotliMiddleware, minimum_size=1000, quality=4)
 
 # 3. CORS - Cross-Origin
 app.add_middleware(
@@ -105,8 +161,11 @@ app.add_middleware(
 @app.exception_handler(ContentFlowException)
 async def content_flow_exception_handler(request, exc: ContentFlowException):
     """Handle domain-specific exceptions"""
-    logger.error(f"ContentFlow Error: {exc.detail}", exc_info=True)
-    return JSONResponse(
+    # Full tracebacks only in debug: formatting them is pure Python and
+    # dominates under bursts of failing requests
+    logger.error("contentflow_error", detail=exc.detail, code=exc.code,
+                 exc_info=settings.DEBUG)
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={"error": exc.detail, "code": exc.code},
     )
@@ -115,8 +174,11 @@ async def content_flow_exception_handler(request, exc: ContentFlowException):
 @app.exception_handler(Exception)
 async def general_exception_handler(request, exc: Exception):
     """Handle unexpected exceptions"""
-    logger.error(f"Unexpected error: {str(exc)}", exc_info=True)
-    return JSONResponse(
+    # Last-resort handler: always keep the traceback — without it a novel
+    # production failure is just a bare str(exc). Debug-gating tracebacks
+    # is for the hot, expected-error path above, not here.
+    logger.error("unhandled_error", error=str(exc), exc_info=True)
+    return ORJSONResponse(
         status_code=500,
         content={"error": "Internal server error", "code": "INTERNAL_ERROR"},
     )
@@ -146,15 +208,70 @@ async def root():
 
 
 # ============================================================================
-# REGISTER ROUTES
+# WEBSOCKET HANDLER (Real-time processing updates)
 # ============================================================================
-app.include_router(api_router, prefix="/api", tags=["Content Generation"])
+# Producers never touch the socket: each session gets a bounded queue and a
+# single writer task, so broadcast_update is an O(1) put with no contention
+# on the WebSocket write lock.
+active_connections: dict[str, asyncio.Queue] = {}
 
 
-# ============================================================================
-# WEBSOCKET HANDLER (Real-time processing updates)
-# ============================================================================
-active_connections: dict[str, WebSocket] = {}
+# Coalescing window for the writer: under a burst, events arriving within
+# 5 ms ride in one frame instead of paying per-frame framing/syscall cost.
+_WS_BATCH_MAX_EVENTS = 32
+_WS_BATCH_WINDOW_SECONDS = 0.005
+
+
+# TCP_NODELAY is not set here: uvicorn doesn't expose the transport in
+# the ASGI scope, and asyncio already disables Nagle on every socket
+# transport it creates — small progress frames flush immediately as-is.
+
+async def _session_writer(websocket: WebSocket, queue: asyncio.Queue):
+    """
+    Drain a session's queue onto its socket (single writer per session).
+
+    A lone event goes out as-is; when more arrive within the coalescing
+    window they're sent as one {"type": "batch", "batch": [...]} frame,
+    cutting framing passes and client event-loop wakeups during bursts.
+    """
+    loop = asyncio.get_running_loop()
+    while True:
+        batch = [await queue.get()]
+        deadline = loop.time() + _WS_BATCH_WINDOW_SECONDS
+        while len(batch) < _WS_BATCH_MAX_EVENTS:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+        if len(batch) == 1:
+            await websocket.send_bytes(orjson.dumps(batch[0]))
+        else:
+            await websocket.send_bytes(
+                orjson.dumps({"type": "batch", "batch": batch})
+            )
+
+
+async def _redis_listener(session_id: str):
+    """
+    Forward Celery worker progress (published on job:{session_id}) into
+    the session's local queue.
+    """
+    import redis.asyncio as aioredis
+
+    redis = aioredis.from_url(settings.REDIS_URL + "/0")
+    pubsub = redis.pubsub()
+    await pubsub.subscribe(f"job:{session_id}")
+    try:
+        async for msg in pubsub.listen():
+            if msg["type"] != "message":
+                continue
+            await broadcast_update(session_id, orjson.loads(msg["data"]))
+    finally:
+        await pubsub.unsubscribe()
+        await redis.aclose()
 
 
 @app.websocket("/ws/process/{session_id}")
@@ -162,40 +279,53 @@ async def websocket_endpoint(websocket: WebSocket, session_id: str):
     """
     WebSocket endpoint for real-time processing updates.
     Clients connect here to receive streaming progress updates.
-    
+
     Message format:
     {
         "type": "status" | "progress" | "error" | "complete",
         "data": {...}
     }
+
+    Bursts may arrive coalesced as {"type": "batch", "batch": [messages]}.
     """
     await websocket.accept()
-    active_connections[session_id] = websocket
-    
+    queue: asyncio.Queue = asyncio.Queue(maxsize=settings.QUEUE_MAX_SIZE)
+    active_connections[session_id] = queue
+    writer_task = asyncio.create_task(_session_writer(websocket, queue))
+    listener_task = asyncio.create_task(_redis_listener(session_id))
+
+    log = logger.bind(session_id=session_id)
     try:
-        logger.info(f"📡 WebSocket connected: {session_id}")
-        
+        log.info("📡 WebSocket connected")
+
         while True:
             # Keep connection alive and handle incoming messages
             data = await websocket.receive_text()
-            logger.debug(f"Received from {session_id}: {data}")
-            
+            log.debug("ws_recv", size=len(data))
+
     except WebSocketDisconnect:
-        del active_connections[session_id]
-        logger.info(f"📡 WebSocket disconnected: {session_id}")
+        log.info("📡 WebSocket disconnected")
     except Exception as e:
-        logger.error(f"WebSocket error for {session_id}: {str(e)}")
-        if session_id in active_connections:
-            del active_connections[session_id]
+        log.error("ws_error", error=str(e))
+    finally:
+        # Single atomic cleanup for every exit path — no KeyError race
+        # with concurrent broadcasts and no leaked session entries
+        active_connections.pop(session_id, None)
+        writer_task.cancel()
+        listener_task.cancel()
 
 
 async def broadcast_update(session_id: str, message: dict):
     """Broadcast progress updates to connected clients"""
-    if session_id in active_connections:
-        try:
-            await active_connections[session_id].send_json(message)
-        except Exception as e:
-            logger.error(f"Failed to send update to {session_id}: {str(e)}")
+    queue = active_connections.get(session_id)
+    if queue is None:
+        return
+    try:
+        queue.put_nowait(message)
+    except asyncio.QueueFull:
+        # Drop the oldest update — newer progress supersedes it
+        queue.get_nowait()
+        queue.put_nowait(message)
 
 
 # ============================================================================
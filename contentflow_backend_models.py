@@ -4,20 +4,33 @@ SQLAlchemy ORM models for ContentFlow.
 Includes Content, ProcessingJob, and EmbeddingCache models.
 """
 
+import uuid
 from datetime import datetime
-from uuid import uuid4
 from typing import Optional
 
+import uuid_utils
 from sqlalchemy import (
-    Column, String, Text, DateTime, Boolean, Integer, Float, JSON, Enum, ForeignKey, Index
+    String, Text, DateTime, Boolean, Integer, Float, Enum, ForeignKey, Index, func, text
 )
-from sqlalchemy.dialects.postgresql import UUID, JSONB, VECTOR
-from sqlalchemy.orm import relationship
+from pgvector.sqlalchemy import HALFVEC
+from sqlalchemy.dialects.postgresql import UUID, JSONB
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
 import enum
 
 
+def _uuid7() -> uuid.UUID:
+    """
+    Time-ordered UUIDv7 primary key default.
+
+    Unlike uuid4, v7 keys append to the rightmost B-tree leaf, so
+    insert-heavy tables (audit_logs, embedding_cache) avoid random-page
+    writes and index bloat. Coerced to the stdlib type asyncpg expects.
+    """
+    return uuid.UUID(bytes=uuid_utils.uuid7().bytes)
+
+
 # ============================================================================
 # ENUMS
 # ============================================================================
@@ -58,52 +71,73 @@ class Content(Base):
     Links to source material and generated outputs.
     """
     __tablename__ = "contents"
-    
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
-    user_id = Column(String(255), nullable=False, index=True)
-    
+
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=_uuid7)
+    user_id: Mapped[str] = mapped_column(String(255), index=True)
+
     # Source information
-    source_type = Column(Enum(ContentSourceEnum), nullable=False)
-    source_url = Column(String(2048), nullable=False)
-    source_title = Column(String(512), nullable=True)
-    source_metadata = Column(JSONB, default={})
-    
+    source_type: Mapped[ContentSourceEnum] = mapped_column(Enum(ContentSourceEnum))
+    source_url: Mapped[str] = mapped_column(String(2048))
+    source_title: Mapped[Optional[str]] = mapped_column(String(512))
+    source_metadata: Mapped[dict] = mapped_column(JSONB, default=dict)
+
     # Extracted content
-    raw_text = Column(Text, nullable=False)
-    cleaned_text = Column(Text, nullable=True)
-    key_points = Column(JSONB, default=[])
-    summary = Column(Text, nullable=True)
-    
-    # Embeddings for semantic search
-    embedding = Column(VECTOR(1536), nullable=True)  # OpenAI embedding dimension
-    embedding_model = Column(String(255), nullable=True)
-    
+    raw_text: Mapped[str] = mapped_column(Text)
+    cleaned_text: Mapped[Optional[str]] = mapped_column(Text)
+    key_points: Mapped[list] = mapped_column(JSONB, default=list)
+    summary: Mapped[Optional[str]] = mapped_column(Text)
+
+    # Embeddings for semantic search. FP16 halfvec halves storage and index
+    # scan bandwidth vs FP32 at negligible cosine-recall loss (pgvector 0.7+).
+    embedding: Mapped[Optional[list]] = mapped_column(HALFVEC(1536))  # OpenAI embedding dimension
+    embedding_model: Mapped[Optional[str]] = mapped_column(String(255))
+
     # Generated outputs
-    generated_content = Column(JSONB, default={})  # {content_type: {...}, ...}
-    
+    generated_content: Mapped[dict] = mapped_column(JSONB, default=dict)  # {content_type: {...}, ...}
+
     # Metadata
-    processing_time_ms = Column(Integer, nullable=True)
-    token_count_input = Column(Integer, nullable=True)
-    token_count_output = Column(Integer, nullable=True)
-    cost_usd = Column(Float, nullable=True)
-    
-    is_public = Column(Boolean, default=False)
-    is_archived = Column(Boolean, default=False)
-    
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
-    
+    processing_time_ms: Mapped[Optional[int]] = mapped_column(Integer)
+    token_count_input: Mapped[Optional[int]] = mapped_column(Integer)
+    token_count_output: Mapped[Optional[int]] = mapped_column(Integer)
+    cost_usd: Mapped[Optional[float]] = mapped_column(Float)
+
+    is_public: Mapped[bool] = mapped_column(Boolean, default=False)
+    is_archived: Mapped[bool] = mapped_column(Boolean, default=False)
+
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
+    updated_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime, server_default=func.now(), onupdate=func.now()
+    )
+
     # Relationships
-    processing_jobs = relationship("ProcessingJob", back_populates="content", cascade="all, delete-orphan")
-    
-    # Indexes for fast queries
+    processing_jobs: Mapped[list["ProcessingJob"]] = relationship(
+        back_populates="content",
+        cascade="all, delete-orphan",
+        order_by="ProcessingJob.created_at",
+    )
+
+    @property
+    def processing_job(self) -> Optional["ProcessingJob"]:
+        """
+        Latest processing job, matching ContentResponse.processing_job.
+        Only valid when processing_jobs was eager-loaded — lazy access
+        raises MissingGreenlet under async.
+        """
+        return self.processing_jobs[-1] if self.processing_jobs else None
+
+    # Indexes for fast queries. The composite (user_id, created_at DESC)
+    # index serves the "my content, newest first" pagination path with an
+    # ordered index scan instead of a filter + sort.
     __table_args__ = (
-        Index("ix_content_user_id", "user_id"),
+        Index("ix_content_user_created", "user_id", text("created_at DESC")),
         Index("ix_content_source_type", "source_type"),
-        Index("ix_content_created_at", "created_at"),
-        Index("ix_content_embedding", "embedding", postgresql_using="ivfflat", postgresql_with={"opclass": "vector_cosine_ops"}),
+        # GIN backs @> containment lookups on generated outputs
+        Index("ix_content_generated_content_gin", "generated_content", postgresql_using="gin"),
+        # halfvec_cosine_ops matches the <=> queries; postgresql_ops is how
+        # SQLAlchemy emits a per-column operator class
+        Index("ix_content_embedding", "embedding", postgresql_using="ivfflat", postgresql_ops={"embedding": "halfvec_cosine_ops"}),
     )
-    
+
     def __repr__(self):
         return f"<Content id={self.id} source={self.source_type}>"
 
@@ -114,39 +148,45 @@ class ProcessingJob(Base):
     Used for job queue and real-time status updates.
     """
     __tablename__ = "processing_jobs"
-    
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
-    content_id = Column(UUID(as_uuid=True), ForeignKey("contents.id"), nullable=False)
-    
+
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=_uuid7)
+    content_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("contents.id"))
+
     # Processing information
-    status = Column(Enum(ProcessingStatusEnum), default=ProcessingStatusEnum.PENDING, nullable=False)
-    progress_percent = Column(Integer, default=0, nullable=False)
-    current_step = Column(String(255), nullable=True)
-    
+    status: Mapped[ProcessingStatusEnum] = mapped_column(
+        Enum(ProcessingStatusEnum), default=ProcessingStatusEnum.PENDING
+    )
+    progress_percent: Mapped[int] = mapped_column(Integer, default=0)
+    current_step: Mapped[Optional[str]] = mapped_column(String(255))
+
     # Results
-    output_content_types = Column(JSON, default=[])  # e.g., ["linkedin_carousel", "twitter_thread"]
-    error_message = Column(Text, nullable=True)
-    error_code = Column(String(50), nullable=True)
-    
+    output_content_types: Mapped[list] = mapped_column(JSONB, default=list)  # e.g., ["linkedin_carousel", "twitter_thread"]
+    error_message: Mapped[Optional[str]] = mapped_column(Text)
+    error_code: Mapped[Optional[str]] = mapped_column(String(50))
+
     # Timing
-    started_at = Column(DateTime, nullable=True)
-    completed_at = Column(DateTime, nullable=True)
-    estimated_time_remaining_seconds = Column(Integer, nullable=True)
-    
+    started_at: Mapped[Optional[datetime]] = mapped_column(DateTime)
+    completed_at: Mapped[Optional[datetime]] = mapped_column(DateTime)
+    estimated_time_remaining_seconds: Mapped[Optional[int]] = mapped_column(Integer)
+
     # Session tracking (for WebSocket)
-    session_id = Column(String(255), nullable=True, index=True)
-    
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
-    
+    session_id: Mapped[Optional[str]] = mapped_column(String(255), index=True)
+
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
+    updated_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime, server_default=func.now(), onupdate=func.now()
+    )
+
     # Relationships
-    content = relationship("Content", back_populates="processing_jobs")
-    
+    content: Mapped["Content"] = relationship(back_populates="processing_jobs")
+
     __table_args__ = (
         Index("ix_processing_job_status", "status"),
         Index("ix_processing_job_session_id", "session_id"),
+        # Speeds batched eager loads of Content.processing_jobs
+        Index("ix_processing_jobs_content_id_created", "content_id", "created_at"),
     )
-    
+
     def __repr__(self):
         return f"<ProcessingJob id={self.id} status={self.status}>"
 
@@ -157,29 +197,31 @@ class EmbeddingCache(Base):
     Improves performance when processing similar content.
     """
     __tablename__ = "embedding_cache"
-    
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
-    
+
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=_uuid7)
+
     # Content identifier
-    content_hash = Column(String(64), nullable=False, unique=True, index=True)
-    content_preview = Column(String(512), nullable=False)
-    
-    # Embedding
-    embedding = Column(VECTOR(1536), nullable=False)
-    embedding_model = Column(String(255), nullable=False)
-    
+    content_hash: Mapped[str] = mapped_column(String(64), unique=True, index=True)
+    content_preview: Mapped[str] = mapped_column(String(512))
+
+    # Embedding (FP16 — see Content.embedding)
+    embedding: Mapped[list] = mapped_column(HALFVEC(1536))
+    embedding_model: Mapped[str] = mapped_column(String(255))
+
     # Metadata
-    similarity_score = Column(Float, nullable=True)
-    usage_count = Column(Integer, default=0)
-    
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    accessed_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
-    
+    similarity_score: Mapped[Optional[float]] = mapped_column(Float)
+    usage_count: Mapped[int] = mapped_column(Integer, default=0)
+
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
+    accessed_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime, server_default=func.now(), onupdate=func.now()
+    )
+
     __table_args__ = (
         Index("ix_embedding_cache_content_hash", "content_hash"),
-        Index("ix_embedding_cache_embedding", "embedding", postgresql_using="ivfflat"),
+        Index("ix_embedding_cache_embedding", "embedding", postgresql_using="ivfflat", postgresql_ops={"embedding": "halfvec_cosine_ops"}),
     )
-    
+
     def __repr__(self):
         return f"<EmbeddingCache id={self.id} model={self.embedding_model}>"
 
@@ -189,23 +231,23 @@ class APIKey(Base):
     Manages user API keys for programmatic access.
     """
     __tablename__ = "api_keys"
-    
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
-    user_id = Column(String(255), nullable=False, index=True)
-    
-    key_hash = Column(String(255), nullable=False, unique=True, index=True)
-    key_name = Column(String(255), nullable=False)
-    
-    is_active = Column(Boolean, default=True)
-    last_used_at = Column(DateTime, nullable=True)
-    
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    expires_at = Column(DateTime, nullable=True)
-    
+
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=_uuid7)
+    user_id: Mapped[str] = mapped_column(String(255), index=True)
+
+    key_hash: Mapped[str] = mapped_column(String(255), unique=True, index=True)
+    key_name: Mapped[str] = mapped_column(String(255))
+
+    is_active: Mapped[bool] = mapped_column(Boolean, default=True)
+    last_used_at: Mapped[Optional[datetime]] = mapped_column(DateTime)
+
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
+    expires_at: Mapped[Optional[datetime]] = mapped_column(DateTime)
+
     __table_args__ = (
         Index("ix_api_keys_user_id", "user_id"),
     )
-    
+
     def __repr__(self):
         return f"<APIKey user={self.user_id}>"
 
@@ -213,25 +255,32 @@ class APIKey(Base):
 class AuditLog(Base):
     """
     Audit trail for important actions (deletion, sharing, etc.)
+
+    Range-partitioned by month on created_at: queries prune to the touched
+    partitions and retention becomes DROP PARTITION instead of a bulk
+    DELETE. Monthly children are created in init_db().
     """
     __tablename__ = "audit_logs"
-    
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
-    user_id = Column(String(255), nullable=False, index=True)
-    
-    action = Column(String(50), nullable=False)  # create, update, delete, share
-    resource_type = Column(String(50), nullable=False)  # content, api_key
-    resource_id = Column(UUID(as_uuid=True), nullable=True)
-    
-    details = Column(JSONB, default={})
-    ip_address = Column(String(45), nullable=True)
-    
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
-    
+
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=_uuid7)
+    user_id: Mapped[str] = mapped_column(String(255), index=True)
+
+    action: Mapped[str] = mapped_column(String(50))  # create, update, delete, share
+    resource_type: Mapped[str] = mapped_column(String(50))  # content, api_key
+    resource_id: Mapped[Optional[uuid.UUID]] = mapped_column(UUID(as_uuid=True))
+
+    details: Mapped[dict] = mapped_column(JSONB, default=dict)
+    ip_address: Mapped[Optional[str]] = mapped_column(String(45))
+
+    # Part of the PK: Postgres requires the partition key in unique indexes
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, primary_key=True, server_default=func.now(), index=True
+    )
+
     __table_args__ = (
-        Index("ix_audit_logs_user_id", "user_id"),
-        Index("ix_audit_logs_created_at", "created_at"),
+        Index("ix_audit_logs_user_created", "user_id", text("created_at DESC")),
+        {"postgresql_partition_by": "RANGE (created_at)"},
     )
-    
+
     def __repr__(self):
         return f"<AuditLog action={self.action} resource={self.resource_type}>"
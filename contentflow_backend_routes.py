@@ -4,26 +4,35 @@ API Route handlers for ContentFlow.
 Includes endpoints for content generation, retrieval, and management.
 """
 
+from functools import lru_cache
 from uuid import UUID, uuid4
 from typing import Optional, List
-from datetime import datetime
 
-from fastapi import APIRouter, Depends, Query, HTTPException, BackgroundTasks, status
-from sqlalchemy import select, desc
+import orjson
+from fastapi import APIRouter, Depends, Query, HTTPException, Request, Response, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select, desc, func, lambda_stmt
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
+from app.config import settings
 from app.database import get_db
 from app.models import Content, ProcessingJob, ProcessingStatusEnum
 from app.schemas import (
     ContentGenerationRequest,
+    BatchProcessingRequest,
     ContentResponse,
     ContentListResponse,
     ProcessingJobResponse,
     ErrorResponse,
     PaginationParams,
     ContentExportRequest,
+    SortField,
+    GenerateResponse,
+    BatchGenerateResponse,
+    ExportResponse,
 )
-from app.services.ai_orchestrator import AIOrchestrator
+from app.tasks import process_content_task, process_batch_task
 from app.utils.logger import setup_logger
 from app.utils.exceptions import ContentFlowException, ValidationError
 
@@ -35,27 +44,46 @@ logger = setup_logger(__name__)
 # DEPENDENCIES
 # ============================================================================
 
-async def get_user_id(request) -> str:
+async def get_user_id(request: Request) -> str:
     """Extract user ID from request (auth token, session, etc.)"""
     # TODO: Implement real authentication
     return "user_demo"
 
 
+@lru_cache(maxsize=1)
+def _get_redis():
+    """Shared redis.asyncio client for response caching (DB 0)"""
+    import redis.asyncio as aioredis
+
+    return aioredis.from_url(settings.REDIS_URL + "/0")
+
+
+# Dict dispatch on the validated enum — unsortable columns are rejected
+# by FastAPI with a 422 before the handler runs. Module-level lambdas
+# keep a stable identity, so lambda_stmt's compilation cache hits.
+_SORT_LAMBDAS = {
+    SortField.CREATED_AT: lambda s: s.order_by(desc(Content.created_at)),
+    SortField.UPDATED_AT: lambda s: s.order_by(desc(Content.updated_at)),
+}
+
+
 # ============================================================================
 # CONTENT GENERATION ENDPOINTS
 # ============================================================================
 
 @router.post(
     "/generate",
-    response_model=dict,
+    # Typed response model: serialization runs in pydantic-core instead
+    # of jsonable_encoder's reflective Python walk over a dict
+    response_model=GenerateResponse,
     status_code=status.HTTP_202_ACCEPTED,
     summary="Generate content from source",
     description="Asynchronously generate content from a YouTube URL or article",
 )
 async def generate_content(
     request: ContentGenerationRequest,
-    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
+    user_id: str = Depends(get_user_id),
 ):
     """
     Generate multi-format social media content from a source.
@@ -77,9 +105,11 @@ async def generate_content(
         
         # Create content record
         content = Content(
-            user_id="user_demo",  # Replace with real user
+            user_id=user_id,
             source_type=request.source_type,
-            source_url=request.source_url,
+            # HttpUrl isn't a str in pydantic v2; the column wants one
+            source_url=str(request.source_url),
+            raw_text="",  # NOT NULL; the worker fills it after extraction
             source_metadata={
                 "tone": request.tone,
                 "target_audience": request.target_audience,
@@ -97,27 +127,28 @@ async def generate_content(
         
         db.add(content)
         db.add(job)
+        # No refresh: the UUIDv7 id is generated client-side by the column
+        # default, so it's already on the instance — a refresh would be a
+        # second SELECT round trip for values we have
         await db.commit()
-        await db.refresh(job)
-        
+
         logger.info(f"📝 Processing job created: {job.id}")
         
-        # Queue background task
-        background_tasks.add_task(
-            process_content_task,
+        # Hand the job to the Celery worker pool — the API process is done
+        # after this INSERT + COMMIT; progress flows back via Redis pub/sub
+        process_content_task.apply_async(
+            args=[str(job.id), session_id, request.model_dump(mode="json")],
+            queue="generation",
+        )
+
+        return GenerateResponse(
             job_id=job.id,
             session_id=session_id,
-            request=request,
+            status="queued",
+            message="Processing started. Connect to WebSocket for updates.",
+            ws_url=f"/ws/process/{session_id}",
         )
         
-        return {
-            "job_id": str(job.id),
-            "session_id": session_id,
-            "status": "queued",
-            "message": "Processing started. Connect to WebSocket for updates.",
-            "ws_url": f"/ws/process/{session_id}",
-        }
-        
     except Exception as e:
         logger.error(f"❌ Content generation failed: {str(e)}", exc_info=True)
         raise HTTPException(
@@ -126,55 +157,396 @@ async def generate_content(
         )
 
 
-async def process_content_task(
-    job_id: UUID,
-    session_id: str,
-    request: ContentGenerationRequest,
+@router.post(
+    "/generate/batch",
+    response_model=BatchGenerateResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Generate content from multiple sources",
+    description="Queue up to 10 URLs for processing with bounded concurrency",
+)
+async def generate_content_batch(
+    request: BatchProcessingRequest,
+    db: AsyncSession = Depends(get_db),
+    user_id: str = Depends(get_user_id),
 ):
     """
-    Background task to process content asynchronously.
-    Updates progress via WebSocket.
+    Queue a batch of URLs for content generation.
+
+    All jobs share one session_id (and WebSocket channel); the worker
+    processes them through a bounded producer/consumer queue, so a batch
+    never floods upstream LLM APIs.
     """
-    async with get_db() as db:
-        try:
-            job = await db.get(ProcessingJob, job_id)
-            if not job:
-                logger.error(f"Job not found: {job_id}")
-                return
-            
-            # Update status
-            job.status = ProcessingStatusEnum.PROCESSING
-            job.started_at = datetime.utcnow()
-            await db.commit()
-            
-            # Initialize orchestrator
-            orchestrator = AIOrchestrator()
-            
-            # Process content
-            logger.info(f"🔄 Processing job {job_id}: {request.source_url}")
-            
-            # Step 1: Extract content (20%)
-            job.current_step = "Extracting content..."
-            job.progress_percent = 20
-            await db.commit()
-            
-            content_data = await orchestrator.extract_content(
-                url=request.source_url,
+    try:
+        session_id = str(uuid4())
+        job_specs = []
+        jobs = []
+
+        for url in request.urls:
+            content = Content(
+                user_id=user_id,
                 source_type=request.source_type,
+                source_url=str(url),
+                raw_text="",  # NOT NULL; the worker fills it after extraction
+                source_metadata={},
+            )
+            job = ProcessingJob(
+                content=content,
+                status=ProcessingStatusEnum.PENDING,
+                session_id=session_id,
+                output_content_types=[ct.value for ct in request.content_types],
             )
-            
-            # Step 2: Generate content (80%)
-            job.current_step = "Generating content..."
-            job.progress_percent = 50
-            await db.commit()
-            
-            generated = await orchestrator.generate_content(
-                content=content_data,
-                content_types=[ct.value for ct in request.content_types],
-                tone=request.tone,
-                target_audience=request.target_audience,
-                include_hashtags=request.include_hashtags,
+            db.add(content)
+            db.add(job)
+            jobs.append(job)
+
+        # One commit for the whole batch — rows are flushed together.
+        # Column defaults (the UUIDv7 ids) are applied at flush, so the
+        # task payload is built afterwards.
+        await db.commit()
+
+        for job, url in zip(jobs, request.urls):
+            per_url_request = ContentGenerationRequest(
+                source_url=url,
+                source_type=request.source_type,
+                content_types=request.content_types,
             )
-            
-            # Update content with results
-            job.content.raw_text = content_data.get("text", \"\")\n            job.content.summary = content_data.get(\"summary\")\n            job.content.key_points = content_data.get(\"key_points\", [])\n            job.content.generated_content = generated\n            job.content.processing_time_ms = int(\n                (datetime.utcnow() - job.started_at).total_seconds() * 1000)\n            )\n            \n            # Mark as complete\n            job.status = ProcessingStatusEnum.COMPLETED\n            job.progress_percent = 100\n            job.completed_at = datetime.utcnow()\n            job.current_step = \"Complete!\"\n            \n            await db.commit()\n            logger.info(f\"✅ Job {job_id} completed successfully\")\n            \n        except Exception as e:\n            logger.error(f\"❌ Job {job_id} failed: {str(e)}\", exc_info=True)\n            job.status = ProcessingStatusEnum.FAILED\n            job.error_message = str(e)\n            job.error_code = \"PROCESSING_ERROR\"\n            job.completed_at = datetime.utcnow()\n            await db.commit()\n\n\n# ============================================================================\n# CONTENT RETRIEVAL ENDPOINTS\n# ============================================================================\n\n@router.get(\n    \"/contents\",\n    response_model=ContentListResponse,\n    summary=\"List user's content\",\n    description=\"Retrieve paginated list of user's processed content\",\n)\nasync def list_contents(\n    skip: int = Query(0, ge=0),\n    limit: int = Query(20, ge=1, le=100),\n    sort_by: str = Query(\"created_at\"),\n    db: AsyncSession = Depends(get_db),\n):\n    \"\"\"Retrieve paginated list of user's contents\"\"\"\n    \n    try:\n        # Base query\n        query = select(Content).where(\n            Content.user_id == \"user_demo\"\n        )\n        \n        # Sort\n        if sort_by == \"created_at\":\n            query = query.order_by(desc(Content.created_at))\n        elif sort_by == \"updated_at\":\n            query = query.order_by(desc(Content.updated_at))\n        \n        # Get total count\n        count_query = select(len(query.froms[0]))\n        result = await db.execute(query)\n        items = [row[0] for row in result.all()]\n        \n        # Paginate\n        paginated_items = items[skip : skip + limit]\n        \n        return ContentListResponse(\n            items=[ContentResponse.from_orm(item) for item in paginated_items],\n            total=len(items),\n            skip=skip,\n            limit=limit,\n            has_more=(skip + limit) < len(items),\n        )\n        \n    except Exception as e:\n        logger.error(f\"❌ Failed to list contents: {str(e)}\", exc_info=True)\n        raise HTTPException(\n            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,\n            detail=str(e),\n        )\n\n\n@router.get(\n    \"/contents/{content_id}\",\n    response_model=ContentResponse,\n    summary=\"Get content details\",\n)\nasync def get_content(\n    content_id: UUID,\n    db: AsyncSession = Depends(get_db),\n):\n    \"\"\"Retrieve a specific content by ID\"\"\"\n    \n    try:\n        content = await db.get(Content, content_id)\n        \n        if not content:\n            raise HTTPException(\n                status_code=status.HTTP_404_NOT_FOUND,\n                detail=\"Content not found\",\n            )\n        \n        return ContentResponse.from_orm(content)\n        \n    except HTTPException:\n        raise\n    except Exception as e:\n        logger.error(f\"❌ Failed to get content: {str(e)}\", exc_info=True)\n        raise HTTPException(\n            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,\n            detail=str(e),\n        )\n\n\n@router.get(\n    \"/jobs/{job_id}\",\n    response_model=ProcessingJobResponse,\n    summary=\"Get processing job status\",\n)\nasync def get_job_status(\n    job_id: UUID,\n    db: AsyncSession = Depends(get_db),\n):\n    \"\"\"Get the status of a processing job\"\"\"\n    \n    try:\n        job = await db.get(ProcessingJob, job_id)\n        \n        if not job:\n            raise HTTPException(\n                status_code=status.HTTP_404_NOT_FOUND,\n                detail=\"Job not found\",\n            )\n        \n        return ProcessingJobResponse.from_orm(job)\n        \n    except HTTPException:\n        raise\n    except Exception as e:\n        logger.error(f\"❌ Failed to get job: {str(e)}\", exc_info=True)\n        raise HTTPException(\n            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,\n            detail=str(e),\n        )\n\n\n# ============================================================================\n# CONTENT MANAGEMENT ENDPOINTS\n# ============================================================================\n\n@router.delete(\n    \"/contents/{content_id}\",\n    status_code=status.HTTP_204_NO_CONTENT,\n    summary=\"Delete content\",\n)\nasync def delete_content(\n    content_id: UUID,\n    db: AsyncSession = Depends(get_db),\n):\n    \"\"\"Delete a content and related processing jobs\"\"\"\n    \n    try:\n        content = await db.get(Content, content_id)\n        \n        if not content:\n            raise HTTPException(\n                status_code=status.HTTP_404_NOT_FOUND,\n                detail=\"Content not found\",\n            )\n        \n        await db.delete(content)\n        await db.commit()\n        \n        logger.info(f\"🗑️ Content {content_id} deleted\")\n        \n    except HTTPException:\n        raise\n    except Exception as e:\n        await db.rollback()\n        logger.error(f\"❌ Failed to delete content: {str(e)}\", exc_info=True)\n        raise HTTPException(\n            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,\n            detail=str(e),\n        )\n\n\n@router.post(\n    \"/contents/{content_id}/export\",\n    response_model=dict,\n    summary=\"Export content\",\n)\nasync def export_content(\n    content_id: UUID,\n    export_request: ContentExportRequest,\n    db: AsyncSession = Depends(get_db),\n):\n    \"\"\"Export content in various formats\"\"\"\n    \n    try:\n        content = await db.get(Content, content_id)\n        \n        if not content:\n            raise HTTPException(\n                status_code=status.HTTP_404_NOT_FOUND,\n                detail=\"Content not found\",\n            )\n        \n        # Export logic (JSON, CSV, Markdown, etc.)\n        if export_request.format == \"json\":\n            export_data = ContentResponse.from_orm(content).dict()\n        elif export_request.format == \"markdown\":\n            export_data = _content_to_markdown(content)\n        else:\n            raise ValueError(f\"Unsupported format: {export_request.format}\")\n        \n        return {\n            \"success\": True,\n            \"format\": export_request.format,\n            \"data\": export_data,\n        }\n        \n    except HTTPException:\n        raise\n    except Exception as e:\n        logger.error(f\"❌ Export failed: {str(e)}\", exc_info=True)\n        raise HTTPException(\n            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,\n            detail=str(e),\n        )\n\n\ndef _content_to_markdown(content: Content) -> str:\n    \"\"\"Convert content to markdown format\"\"\"\n    lines = [\n        f\"# {content.source_title or 'Untitled'}\",\n        f\"\",\n        f\"**Source:** {content.source_url}\",\n        f\"\",\n    ]\n    \n    if content.summary:\n        lines.extend([\"## Summary\", content.summary, \"\"])\n    \n    if content.key_points:\n        lines.extend([\"## Key Points\"])\n        for point in content.key_points:\n            lines.append(f\"- {point}\")\n        lines.append(\"\")\n    \n    return \"\\n\".join(lines)\n
\ No newline at end of file
+            job_specs.append([str(job.id), per_url_request.model_dump(mode="json")])
+
+        logger.info(f"📝 Batch of {len(jobs)} jobs created (session {session_id})")
+
+        process_batch_task.apply_async(
+            args=[job_specs, session_id],
+            queue="generation",
+        )
+
+        return BatchGenerateResponse(
+            job_ids=[job.id for job in jobs],
+            session_id=session_id,
+            status="queued",
+            message="Batch processing started. Connect to WebSocket for updates.",
+            ws_url=f"/ws/process/{session_id}",
+        )
+
+    except Exception as e:
+        logger.error(f"❌ Batch generation failed: {str(e)}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(e),
+        )
+
+
+# ============================================================================
+# CONTENT RETRIEVAL ENDPOINTS
+# ============================================================================
+
+@router.get(
+    "/contents",
+    response_model=ContentListResponse,
+    response_model_exclude_none=True,
+    summary="List user's content",
+    description="Retrieve paginated list of user's processed content",
+)
+async def list_contents(
+    skip: int = Query(0, ge=0),
+    limit: int = Query(20, ge=1, le=100),
+    sort_by: SortField = Query(SortField.CREATED_AT),
+    db: AsyncSession = Depends(get_db),
+    user_id: str = Depends(get_user_id),
+):
+    """Retrieve paginated list of user's contents"""
+    
+    try:
+        # Pagination happens in Postgres: the page query moves O(limit)
+        # rows, never the user's whole history, and count(*) OVER () rides
+        # along with each row so page + total are one round trip. (An
+        # asyncio.gather over two queries on the same AsyncSession is NOT
+        # safe — sessions aren't shareable across concurrent tasks.)
+        # lambda_stmt memoizes SQL compilation by lambda identity; user_id
+        # is a closure literal, so it's tracked as a bind parameter — one
+        # cache entry serves every user.
+        # selectinload batches all jobs for the page in one extra query —
+        # without it each row's processing_job is an N+1 lazy load, which
+        # raises MissingGreenlet in async anyway
+        query = lambda_stmt(
+            lambda: select(Content, func.count().over().label("total"))
+            .options(selectinload(Content.processing_jobs))
+            .where(Content.user_id == user_id)
+        )
+
+        # Sort — the (user_id, created_at DESC) composite index serves the
+        # default ordering as a pure index scan
+        query += _SORT_LAMBDAS[sort_by]
+        query += lambda s: s.limit(limit).offset(skip)
+
+        result = await db.execute(query)
+        rows = result.all()
+        items = [row[0] for row in rows]
+
+        if rows:
+            total = rows[0].total
+        else:
+            # Page past the end: fall back to a count so total stays honest
+            total = await db.scalar(
+                select(func.count())
+                .select_from(Content)
+                .where(Content.user_id == user_id)
+            ) or 0
+
+        # Items are already validated; model_construct skips a second pass
+        return ContentListResponse.model_construct(
+            items=[ContentResponse.model_validate(item) for item in items],
+            total=total,
+            skip=skip,
+            limit=limit,
+            has_more=(skip + limit) < total,
+        )
+        
+    except Exception as e:
+        logger.error(f"❌ Failed to list contents: {str(e)}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(e),
+        )
+
+
+# Completed content is immutable, so an hour of staleness is safe; the
+# cache is invalidated on delete and when the worker finishes a job.
+_CONTENT_CACHE_TTL_SECONDS = 3600
+
+
+@router.get(
+    "/contents/{content_id}",
+    response_model=ContentResponse,
+    summary="Get content details",
+)
+async def get_content(
+    content_id: UUID,
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Retrieve a specific content by ID.
+
+    Completed contents are served from a Redis cache (etag + body under
+    content:{id}) and honor If-None-Match with a bodyless 304, so repeat
+    reads skip Postgres, the ORM and JSON encoding entirely.
+    """
+
+    try:
+        cache_key = f"content:{content_id}"
+        if_none_match = request.headers.get("if-none-match")
+
+        # Cache hit: payload is "<etag>\n<orjson body>"
+        try:
+            cached = await _get_redis().get(cache_key)
+        except Exception as e:
+            logger.warning(f"⚠️ Content cache read failed: {str(e)}")
+            cached = None
+        if cached is not None:
+            etag, _, body = cached.partition(b"\n")
+            etag = etag.decode()
+            if if_none_match == etag:
+                return Response(status_code=status.HTTP_304_NOT_MODIFIED,
+                                headers={"ETag": etag})
+            return Response(content=body, media_type="application/json",
+                            headers={"ETag": etag})
+
+        content = await db.get(
+            Content, content_id,
+            options=[selectinload(Content.processing_jobs)],
+        )
+
+        if not content:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Content not found",
+            )
+
+        etag = f'W/"{content.id}-{content.updated_at.timestamp()}"'
+        if if_none_match == etag:
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED,
+                            headers={"ETag": etag})
+
+        body = orjson.dumps(
+            ContentResponse.model_validate(content).model_dump(mode="json")
+        )
+
+        # Only cache once the latest job has completed — in-flight content
+        # still mutates and would serve stale partial results
+        job = content.processing_job
+        if job is not None and job.status == ProcessingStatusEnum.COMPLETED:
+            try:
+                await _get_redis().setex(
+                    cache_key, _CONTENT_CACHE_TTL_SECONDS,
+                    etag.encode() + b"\n" + body,
+                )
+            except Exception as e:
+                logger.warning(f"⚠️ Content cache write failed: {str(e)}")
+
+        return Response(content=body, media_type="application/json",
+                        headers={"ETag": etag})
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"❌ Failed to get content: {str(e)}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(e),
+        )
+
+
+@router.get(
+    "/jobs/{job_id}",
+    response_model=ProcessingJobResponse,
+    summary="Get processing job status",
+)
+async def get_job_status(
+    job_id: UUID,
+    db: AsyncSession = Depends(get_db),
+):
+    """Get the status of a processing job"""
+    
+    try:
+        job = await db.get(ProcessingJob, job_id)
+        
+        if not job:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Job not found",
+            )
+        
+        return ProcessingJobResponse.model_validate(job)
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"❌ Failed to get job: {str(e)}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(e),
+        )
+
+
+# ============================================================================
+# CONTENT MANAGEMENT ENDPOINTS
+# ============================================================================
+
+@router.delete(
+    "/contents/{content_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    summary="Delete content",
+)
+async def delete_content(
+    content_id: UUID,
+    db: AsyncSession = Depends(get_db),
+):
+    """Delete a content and related processing jobs"""
+    
+    try:
+        content = await db.get(Content, content_id)
+        
+        if not content:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Content not found",
+            )
+        
+        await db.delete(content)
+        await db.commit()
+
+        try:
+            await _get_redis().delete(f"content:{content_id}")
+        except Exception as e:
+            logger.warning(f"⚠️ Content cache invalidation failed: {str(e)}")
+
+        logger.info(f"🗑️ Content {content_id} deleted")
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        await db.rollback()
+        logger.error(f"❌ Failed to delete content: {str(e)}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(e),
+        )
+
+
+@router.post(
+    "/contents/{content_id}/export",
+    response_model=ExportResponse,
+    summary="Export content",
+)
+async def export_content(
+    content_id: UUID,
+    export_request: ContentExportRequest,
+    db: AsyncSession = Depends(get_db),
+):
+    """Export content in various formats"""
+
+    try:
+        # Eager-load jobs: ContentResponse reads the processing_job
+        # property, which raises MissingGreenlet on an unloaded collection
+        content = await db.get(
+            Content, content_id,
+            options=[selectinload(Content.processing_jobs)],
+        )
+        
+        if not content:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Content not found",
+            )
+        
+        # Export logic (JSON, CSV, Markdown, etc.). Both formats stream:
+        # the response starts flowing before the full document is
+        # materialized, so TTFB and memory stay flat as
+        # generated_content grows to megabytes.
+        if export_request.format == "json":
+            export_data = ContentResponse.model_validate(content).model_dump(mode="json")
+
+            async def _json_stream():
+                yield b'{"success":true,"format":"json","data":'
+                yield orjson.dumps(export_data)
+                yield b"}"
+
+            return StreamingResponse(_json_stream(), media_type="application/json")
+        elif export_request.format == "markdown":
+            # Serve markdown raw — wrapping a large document in a JSON
+            # string just to unwrap it client-side doubles the encode cost
+            return StreamingResponse(
+                _content_to_markdown_chunks(content),
+                media_type="text/markdown",
+            )
+        else:
+            raise ValueError(f"Unsupported format: {export_request.format}")
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"❌ Export failed: {str(e)}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(e),
+        )
+
+
+def _content_to_markdown_chunks(content: Content):
+    """
+    Yield the markdown export section by section.
+
+    Generator form of the old _content_to_markdown: each chunk goes
+    straight onto the wire via StreamingResponse, so the full document
+    is never held in memory. key_points still collapse into one join —
+    hundreds of tiny chunks would trade allocation cost for syscall cost.
+    """
+    yield f"# {content.source_title or 'Untitled'}\n\n**Source:** {content.source_url}\n"
+
+    if content.summary:
+        yield f"\n## Summary\n{content.summary}\n"
+
+    if content.key_points:
+        yield "\n## Key Points\n"
+        yield "\n".join(f"- {point}" for point in content.key_points)
+        yield "\n"
@@ -8,7 +8,7 @@ from typing import Optional, List, Dict, Any
 from enum import Enum
 from uuid import UUID
 
-from pydantic import BaseModel, Field, HttpUrl, validator
+from pydantic import BaseModel, ConfigDict, Field, HttpUrl
 
 
 # ============================================================================
@@ -38,6 +38,12 @@ class ContentSourceEnum(str, Enum):
     TRANSCRIPT = "transcript"
 
 
+class SortField(str, Enum):
+    """Sortable columns for content listings"""
+    CREATED_AT = "created_at"
+    UPDATED_AT = "updated_at"
+
+
 # ============================================================================
 # REQUEST SCHEMAS
 # ============================================================================
@@ -45,7 +51,9 @@ class ContentSourceEnum(str, Enum):
 class ContentGenerationRequest(BaseModel):
     """Request to generate content from a source"""
     
-    source_url: str = Field(..., description="URL of the source (YouTube, article, etc.)")
+    # HttpUrl validates in pydantic-core (Rust) — scheme, host, length —
+    # replacing the hand-rolled startswith check
+    source_url: HttpUrl = Field(..., description="URL of the source (YouTube, article, etc.)")
     source_type: ContentSourceEnum = Field(..., description="Type of source")
     
     content_types: List[ContentTypeEnum] = Field(
@@ -71,13 +79,6 @@ class ContentGenerationRequest(BaseModel):
         default=None,
         description="Custom instructions for content generation"
     )
-    
-    @validator("source_url")
-    def validate_source_url(cls, v):
-        """Validate that source_url is a valid URL"""
-        if not v.startswith(("http://", "https://")):
-            raise ValueError("Source URL must start with http:// or https://")
-        return v
 
 
 class ContentExportRequest(BaseModel):
@@ -91,18 +92,43 @@ class ContentExportRequest(BaseModel):
 class BatchProcessingRequest(BaseModel):
     """Request to process multiple URLs"""
     
-    urls: List[str] = Field(..., description="List of source URLs")
+    urls: List[HttpUrl] = Field(..., max_length=10, description="List of source URLs")
     source_type: ContentSourceEnum = Field(..., description="Type of source")
     content_types: List[ContentTypeEnum] = Field(default=[ContentTypeEnum.LINKEDIN_CAROUSEL])
-    
-    class Config:
-        max_items = 10
 
 
 # ============================================================================
 # RESPONSE SCHEMAS
 # ============================================================================
 
+class GenerateResponse(BaseModel):
+    """Response for a queued generation job"""
+
+    job_id: UUID
+    session_id: str
+    status: str
+    message: str
+    ws_url: str
+
+
+class BatchGenerateResponse(BaseModel):
+    """Response for a queued batch of generation jobs"""
+
+    job_ids: List[UUID]
+    session_id: str
+    status: str
+    message: str
+    ws_url: str
+
+
+class ExportResponse(BaseModel):
+    """Envelope for JSON content exports"""
+
+    success: bool = True
+    format: str
+    data: Dict[str, Any]
+
+
 class ProcessingJobResponse(BaseModel):
     """Response for a processing job"""
     
@@ -120,8 +146,7 @@ class ProcessingJobResponse(BaseModel):
     completed_at: Optional[datetime] = None
     created_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class GeneratedContentItem(BaseModel):
@@ -139,8 +164,7 @@ class GeneratedContentItem(BaseModel):
     character_count: int
     estimated_engagement: Optional[float] = None
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ContentResponse(BaseModel):
@@ -175,8 +199,7 @@ class ContentResponse(BaseModel):
     # Related
     processing_job: Optional[ProcessingJobResponse] = None
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ContentListResponse(BaseModel):
@@ -231,8 +254,7 @@ class ContentStatistics(BaseModel):
     by_content_type: Dict[str, int]
     by_source_type: Dict[str, int]
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class WebSocketMessage(BaseModel):
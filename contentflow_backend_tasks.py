@@ -0,0 +1,303 @@
+# backend/app/tasks.py
+"""
+Celery task definitions for ContentFlow.
+Content processing runs in dedicated worker processes, so the API event
+loop only pays for one INSERT + COMMIT per /generate call and generation
+throughput scales with worker count, not API replicas. Progress is
+published over Redis pub/sub keyed by session_id; the WebSocket handler
+in main.py fans it out to connected clients.
+"""
+
+import asyncio
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+import orjson
+from celery import Celery
+
+from app.config import settings
+from app.utils.exceptions import ExternalServiceError, LLMError
+from app.utils.logger import setup_logger
+
+# Upstream failures worth retrying — provider hiccups and rate limits,
+# as opposed to bad input, which fails the same way every time
+_TRANSIENT_ERRORS = (ExternalServiceError, LLMError)
+
+logger = setup_logger(__name__)
+
+
+# ============================================================================
+# WORKER EVENT LOOP & ENGINE
+# ============================================================================
+# Each worker process keeps one long-lived event loop so the async engine
+# and its connection pool survive across task invocations. asyncio.run
+# would tear the loop down per task, orphaning pooled connections.
+
+_worker_loop: Optional[asyncio.AbstractEventLoop] = None
+_worker_session_factory = None
+
+
+def _get_worker_loop() -> asyncio.AbstractEventLoop:
+    global _worker_loop
+    if _worker_loop is None:
+        _worker_loop = asyncio.new_event_loop()
+    return _worker_loop
+
+
+def _get_worker_sessionmaker():
+    """
+    Worker-local engine + sessionmaker, created lazily on first task.
+
+    This is a separate pool from the API process's engine (a pool can't
+    be shared across processes or event loops); sized to the worker's
+    own concurrency, not API traffic.
+    """
+    global _worker_session_factory
+    if _worker_session_factory is None:
+        from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+        engine = create_async_engine(
+            settings.DATABASE_URL,
+            pool_pre_ping=True,
+            pool_recycle=1800,
+            pool_size=settings.WORKER_COUNT,
+            max_overflow=settings.WORKER_COUNT,
+            pool_timeout=30,
+        )
+        _worker_session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    return _worker_session_factory
+
+
+# ============================================================================
+# CELERY APPLICATION
+# ============================================================================
+
+celery_app = Celery(
+    "contentflow",
+    broker=settings.REDIS_URL + "/1",
+    backend=settings.REDIS_URL + "/2",
+)
+
+celery_app.conf.update(
+    task_serializer="json",
+    result_serializer="json",
+    accept_content=["json"],
+    # LLM-bound work: one long task per worker slot, no prefetch hoarding
+    worker_prefetch_multiplier=1,
+    task_acks_late=True,
+)
+
+
+# ============================================================================
+# PROGRESS PUBLISHING
+# ============================================================================
+
+# Reconnecting clients can GET this key instead of waiting for the next
+# pub/sub message; generous TTL so it outlives the longest job.
+_PROGRESS_TTL_SECONDS = 3600
+
+
+async def _publish_progress(redis, session_id: str, message: dict):
+    """
+    Push a progress update onto the session's pub/sub channel and stash
+    the latest snapshot under a TTL key for late subscribers.
+    """
+    payload = orjson.dumps(message)
+    await redis.publish(f"job:{session_id}", payload)
+    await redis.setex(f"job:{session_id}:state", _PROGRESS_TTL_SECONDS, payload)
+
+
+# ============================================================================
+# CONTENT PROCESSING TASKS
+# ============================================================================
+
+@celery_app.task(
+    bind=True,
+    name="app.tasks.process_content_task",
+    autoretry_for=_TRANSIENT_ERRORS,
+    max_retries=3,
+    retry_backoff=True,
+)
+def process_content_task(self, job_id: str, session_id: str, request_data: dict):
+    """
+    Process a content-generation job end to end.
+
+    Transient upstream failures propagate out of the pipeline and are
+    retried with backoff; anything else marks the job FAILED once.
+    Routing to the generation queue happens at apply_async time.
+
+    Celery tasks are sync; the async pipeline runs on the worker's
+    persistent event loop so the worker engine's pool is reused across
+    invocations.
+    """
+    _get_worker_loop().run_until_complete(
+        _process_content(UUID(job_id), session_id, request_data)
+    )
+
+
+async def _process_content(job_id: UUID, session_id: str, request_data: dict):
+    """Async body of process_content_task (runs in the worker's loop)"""
+    import redis.asyncio as aioredis
+    from sqlalchemy.orm import selectinload
+
+    from app.models import ProcessingJob, ProcessingStatusEnum
+    from app.schemas import ContentGenerationRequest
+    from app.services.ai_orchestrator import get_orchestrator
+
+    request = ContentGenerationRequest(**request_data)
+
+    session_factory = _get_worker_sessionmaker()
+    redis = aioredis.from_url(settings.REDIS_URL + "/0")
+
+    try:
+        async with session_factory() as db:
+            # Eager-load content: lazy loads raise MissingGreenlet in async
+            job = await db.get(
+                ProcessingJob, job_id,
+                options=[selectinload(ProcessingJob.content)],
+            )
+            if not job:
+                logger.error(f"Job not found: {job_id}")
+                return
+
+            try:
+                # Progress is ephemeral — it lives in Redis, not Postgres.
+                # Committing every step meant 3-4 WAL-flushing round trips
+                # per job for state nobody reads after completion; the DB
+                # sees exactly one write, at the terminal state.
+                job.status = ProcessingStatusEnum.PROCESSING
+                job.started_at = datetime.utcnow()
+
+                orchestrator = get_orchestrator()
+
+                logger.info(f"🔄 Processing job {job_id}: {request.source_url}")
+
+                # Step 1: Extract content (20%)
+                await _publish_progress(redis, session_id, {
+                    "type": "progress",
+                    "data": {"percent": 20, "step": "Extracting content..."},
+                })
+
+                content_data = await orchestrator.extract_content(
+                    url=str(request.source_url),
+                    source_type=request.source_type,
+                )
+
+                # Step 2: Generate content (80%)
+                await _publish_progress(redis, session_id, {
+                    "type": "progress",
+                    "data": {"percent": 50, "step": "Generating content..."},
+                })
+
+                generated = await orchestrator.generate_content(
+                    content=content_data,
+                    content_types=[ct.value for ct in request.content_types],
+                    tone=request.tone,
+                    target_audience=request.target_audience,
+                    include_hashtags=request.include_hashtags,
+                )
+
+                # Update content with results
+                job.content.raw_text = content_data.get("text", "")
+                job.content.summary = content_data.get("summary")
+                job.content.key_points = content_data.get("key_points", [])
+                job.content.generated_content = generated
+                job.content.processing_time_ms = int(
+                    (datetime.utcnow() - job.started_at).total_seconds() * 1000
+                )
+
+                # Mark as complete
+                job.status = ProcessingStatusEnum.COMPLETED
+                job.progress_percent = 100
+                job.completed_at = datetime.utcnow()
+                job.current_step = "Complete!"
+
+                await db.commit()
+                # Drop any cached response for this content — the API
+                # caches completed reads under content:{id}
+                await redis.delete(f"content:{job.content_id}")
+                await _publish_progress(redis, session_id, {
+                    "type": "complete",
+                    "data": {"job_id": str(job_id), "percent": 100},
+                })
+                logger.info(f"✅ Job {job_id} completed successfully")
+
+            except Exception as e:
+                logger.error(f"❌ Job {job_id} failed: {str(e)}", exc_info=True)
+                job.status = ProcessingStatusEnum.FAILED
+                job.error_message = str(e)
+                job.error_code = "PROCESSING_ERROR"
+                job.completed_at = datetime.utcnow()
+                await db.commit()
+                await _publish_progress(redis, session_id, {
+                    "type": "error",
+                    "data": {"job_id": str(job_id), "error": str(e)},
+                })
+                # Transient errors bubble up so Celery's autoretry can
+                # re-run the job — a successful retry flips the row back
+                # from FAILED to COMPLETED
+                if isinstance(e, _TRANSIENT_ERRORS):
+                    raise
+    finally:
+        await redis.aclose()
+
+
+# ============================================================================
+# BATCH PROCESSING TASK
+# ============================================================================
+
+# Upstream LLM concurrency per batch. Bounded so a 10-URL batch doesn't
+# fire 10 simultaneous extraction + generation calls and trip provider
+# rate limits.
+_BATCH_WORKERS = 4
+
+
+@celery_app.task(
+    bind=True,
+    name="app.tasks.process_batch_task",
+)
+def process_batch_task(self, job_specs: list, session_id: str):
+    """
+    Process a batch of generation jobs with bounded concurrency.
+
+    job_specs is a list of [job_id, request_data] pairs created by the
+    batch endpoint. No task-level retry: re-running the whole batch
+    would repeat already-completed jobs, so failures stay per-job.
+    """
+    _get_worker_loop().run_until_complete(_process_batch(job_specs, session_id))
+
+
+async def _process_batch(job_specs: list, session_id: str):
+    """
+    Producer/consumer over the batch's jobs.
+
+    The bounded queue is the backpressure: the producer blocks on put()
+    whenever all workers are busy, so at most _BATCH_WORKERS upstream
+    calls are in flight and memory stays flat regardless of batch size.
+    Each job handles its own failure inside _process_content, so one bad
+    URL never cancels its siblings.
+    """
+    queue: asyncio.Queue = asyncio.Queue(maxsize=2)
+
+    async def worker():
+        while (spec := await queue.get()) is not None:
+            job_id, request_data = spec
+            try:
+                await _process_content(UUID(job_id), session_id, request_data)
+            except Exception as e:
+                # _process_content already marked the job FAILED where it
+                # could; swallow here so one bad URL never kills siblings
+                logger.error(f"❌ Batch job {job_id} errored: {str(e)}", exc_info=True)
+            finally:
+                queue.task_done()
+
+    async with asyncio.TaskGroup() as tg:
+        for _ in range(_BATCH_WORKERS):
+            tg.create_task(worker())
+        for spec in job_specs:
+            await queue.put(spec)  # blocks when full — backpressure
+        for _ in range(_BATCH_WORKERS):
+            await queue.put(None)
+
+    logger.info(f"✅ Batch of {len(job_specs)} jobs drained (session {session_id})")
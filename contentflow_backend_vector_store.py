@@ -0,0 +1,153 @@
+# backend/app/services/vector_store.py
+"""
+Vector store helpers backed by pgvector.
+Similarity scoring runs server-side via the <=> operator so Python only
+ever sees the top-K rows.
+"""
+
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+from pgvector.sqlalchemy import HALFVEC
+from sqlalchemy import bindparam, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from app.database import async_session, engine
+from app.models import EmbeddingCache
+from app.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# Below this many rows, per-row INSERT overhead is cheaper than setting
+# up a COPY stream
+_COPY_THRESHOLD = 50
+
+
+# ============================================================================
+# INITIALIZATION
+# ============================================================================
+
+async def init_vector_store():
+    """Ensure the pgvector extension exists before tables are created"""
+    async with engine.begin() as conn:
+        await conn.execute(text("CREATE EXTENSION IF NOT EXISTS vector"))
+    logger.info("✅ Vector store initialized (pgvector)")
+
+
+# ============================================================================
+# SIMILARITY SEARCH
+# ============================================================================
+
+# Statement is built once; the ivfflat index on embedding_cache.embedding
+# serves the ORDER BY so the scan and SIMD distance math stay in Postgres.
+_FIND_SIMILAR_STMT = text(
+    """
+    SELECT id, content_hash, content_preview, embedding <=> :q AS distance
+    FROM embedding_cache
+    ORDER BY embedding <=> :q
+    LIMIT :k
+    """
+).bindparams(bindparam("q", type_=HALFVEC(1536)))
+
+
+async def find_similar(embedding: List[float], top_k: int = 5) -> List[Dict[str, Any]]:
+    """
+    Return the top_k cached embeddings nearest to the given vector.
+
+    Distance is cosine (<=> operator); lower is more similar.
+    """
+    async with async_session() as session:
+        result = await session.execute(
+            _FIND_SIMILAR_STMT, {"q": embedding, "k": top_k}
+        )
+        return [
+            {
+                "id": row.id,
+                "content_hash": row.content_hash,
+                "content_preview": row.content_preview,
+                "distance": row.distance,
+            }
+            for row in result
+        ]
+
+
+async def bulk_cache_embeddings(records: List[Dict[str, Any]]) -> int:
+    """
+    Bulk-insert EmbeddingCache rows.
+
+    Large batches go through asyncpg's COPY binary protocol — one
+    streaming write instead of a round trip per row — staged through a
+    temp table so duplicate content_hashes are skipped exactly like the
+    small-batch path. Small batches use INSERT ... ON CONFLICT DO
+    NOTHING directly.
+
+    Each record needs: id, content_hash, content_preview, embedding,
+    embedding_model.
+
+    Returns the number of rows actually inserted.
+    """
+    if not records:
+        return 0
+
+    columns = ("id", "content_hash", "content_preview", "embedding", "embedding_model")
+
+    if len(records) >= _COPY_THRESHOLD:
+        from pgvector.asyncpg import register_vector
+
+        rows = [tuple(r[c] for c in columns) for r in records]
+        async with engine.connect() as conn:
+            raw = await conn.get_raw_connection()
+            driver = raw.driver_connection
+            # asyncpg has no built-in halfvec codec — without this the
+            # binary COPY fails on the embedding column
+            await register_vector(driver)
+            async with driver.transaction():
+                # COPY can't skip duplicates, so stage into a temp table
+                # and merge with the same ON CONFLICT semantics as the
+                # small-batch path
+                await driver.execute(
+                    "CREATE TEMP TABLE _embedding_cache_stage "
+                    "(LIKE embedding_cache INCLUDING DEFAULTS) ON COMMIT DROP"
+                )
+                await driver.copy_records_to_table(
+                    "_embedding_cache_stage", records=rows, columns=list(columns)
+                )
+                status = await driver.execute(
+                    f"INSERT INTO embedding_cache ({', '.join(columns)}) "
+                    f"SELECT {', '.join(columns)} FROM _embedding_cache_stage "
+                    "ON CONFLICT (content_hash) DO NOTHING"
+                )
+        # asyncpg status string: "INSERT 0 <rowcount>"
+        return int(status.rsplit(" ", 1)[-1])
+
+    async with async_session() as session:
+        stmt = (
+            pg_insert(EmbeddingCache)
+            .values([{c: r[c] for c in columns} for r in records])
+            .on_conflict_do_nothing(index_elements=["content_hash"])
+        )
+        result = await session.execute(stmt)
+        await session.commit()
+        return result.rowcount
+
+
+async def bump_usage(cache_id: UUID) -> Optional[int]:
+    """
+    Increment a cache entry's usage_count in a single UPDATE ... RETURNING
+    round trip (no read-modify-write).
+    """
+    async with async_session() as session:
+        result = await session.execute(
+            text(
+                """
+                UPDATE embedding_cache
+                SET usage_count = usage_count + 1, accessed_at = now()
+                WHERE id = :id
+                RETURNING usage_count
+                """
+            ),
+            {"id": cache_id},
+        )
+        await session.commit()
+        row = result.first()
+        return row.usage_count if row else None